@@ -3,20 +3,36 @@ Flask Backend for Sentiment Analysis Application
 Provides REST endpoints for sentiment analysis
 """
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
+from flask_compress import Compress
 from sentiment_analyzer import SentimentAnalyzer
+from semantic_cache import SemanticCache
+from json_provider import OrjsonProvider
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import copy
+import hashlib
 import os
+import re
+import threading
 from werkzeug.utils import secure_filename
 
 # Initialize Flask app
 app = Flask(__name__, static_folder='.', static_url_path='')
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Configuration
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'txt', 'pdf', 'docx'}
+ALLOWED_EXTENSIONS = ('.txt', '.pdf', '.docx')
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_TEXT_LENGTH = 50000  # characters per analysis
+
+# Paragraph separators: blank lines (including whitespace-only and CRLF ones),
+# with single line breaks as a fallback for one-paragraph files
+PARA_RE = re.compile(r'\n\s*\n')
+LINE_RE = re.compile(r'\r?\n')
 
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
@@ -24,9 +40,195 @@ if not os.path.exists(UPLOAD_FOLDER):
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
+# Compress larger JSON replies (batch and file results are highly repetitive);
+# small replies such as /api/health stay uncompressed
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# The landing page is static: read it once and serve it from memory
+with open(os.path.join(app.root_path, 'index.html'), 'rb') as f:
+    INDEX_BYTES = f.read()
+INDEX_ETAG = hashlib.md5(INDEX_BYTES).hexdigest()
+INDEX_HEADERS = {
+    'ETag': f'"{INDEX_ETAG}"',
+    'Cache-Control': 'public, max-age=300'
+}
+
 # Initialize sentiment analyzer
 analyzer = SentimentAnalyzer()
 
+# Shared worker pool for multi-text requests (created once, not per request)
+WORKERS = min(8, os.cpu_count() or 1)
+EXECUTOR = ThreadPoolExecutor(max_workers=WORKERS)
+
+
+def _reset_executor():
+    """Give a forked child (e.g. a gunicorn worker) its own pool; the parent's threads do not survive fork"""
+    global EXECUTOR
+    EXECUTOR = ThreadPoolExecutor(max_workers=WORKERS)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+# Warm up in the background: the first analysis loads the VADER lexicon, the
+# punkt tokenizer, WordNet and TextBlob's pattern tables, so do it before the
+# first real request instead of during it
+WARMUP = EXECUTOR.submit(analyzer.get_detailed_analysis, "Warm up the analyzer. It works well!")
+
+
+class AnalysisCache:
+    """
+    Thread-safe LRU map from a text to its analysis.
+    
+    Bounded both by entry count and by the total length of the cached texts,
+    since an analysis grows with its text (roughly 10 bytes per character).
+    Stored analyses are shared between requests and must not be mutated;
+    callers hand out deep copies instead.
+    """
+    
+    def __init__(self, maxsize=4096, max_chars=5_000_000):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self._chars = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, text):
+        """Return the cached analysis for text, or None if it is not cached."""
+        with self._lock:
+            analysis = self._entries.get(text)
+            if analysis is not None:
+                self._entries.move_to_end(text)
+            return analysis
+    
+    def put(self, text, analysis):
+        """Cache an analysis, evicting the least recently used entry when full."""
+        with self._lock:
+            if text not in self._entries:
+                self._chars += len(text)
+            self._entries[text] = analysis
+            self._entries.move_to_end(text)
+            while len(self._entries) > self.maxsize or self._chars > self.max_chars:
+                evicted, _ = self._entries.popitem(last=False)
+                self._chars -= len(evicted)
+
+
+analysis_cache = AnalysisCache()
+
+
+def _analyze_shared(texts):
+    """
+    Return the cached analysis of each text, analyzing all misses in batches.
+    
+    Misses are split into one chunk per worker and each chunk is analyzed with
+    a single analyzer batch call. The returned dicts are shared cache entries.
+    """
+    results = [analysis_cache.get(text) for text in texts]
+    missed = list(dict.fromkeys(text for text, cached in zip(texts, results) if cached is None))
+    if not missed:
+        return results
+    
+    chunk_size = -(-len(missed) // WORKERS)
+    chunks = [missed[i:i + chunk_size] for i in range(0, len(missed), chunk_size)]
+    if len(chunks) == 1:
+        batches = [analyzer.get_detailed_analysis_many(missed)]
+    else:
+        batches = EXECUTOR.map(analyzer.get_detailed_analysis_many, chunks)
+    
+    fresh = {}
+    for chunk, analyses in zip(chunks, batches):
+        for text, analysis in zip(chunk, analyses):
+            analysis_cache.put(text, analysis)
+            fresh[text] = analysis
+    
+    return [cached if cached is not None else fresh[text] for text, cached in zip(texts, results)]
+
+
+def analyze_cached(text):
+    """
+    Analyze text, reusing the result of an earlier identical request.
+    
+    Args:
+        text (str): The text to analyze.
+        
+    Returns:
+        dict: A private copy of the detailed analysis, safe for callers to modify.
+    """
+    return copy.deepcopy(_analyze_shared([text])[0])
+
+
+def analyze_many(texts):
+    """
+    Analyze several texts, reusing cached results and batching the rest.
+    
+    Args:
+        texts (list): The texts to analyze.
+        
+    Returns:
+        list: A private copy of the detailed analysis for each text, in order.
+    """
+    return [copy.deepcopy(analysis) for analysis in _analyze_shared(texts)]
+
+
+# Optional near-duplicate cache for /api/analyze and /api/analyze-batch.
+# Enable with SEMANTIC_CACHE=1 (requires sentence-transformers).
+# Only the sentiment scores of a paraphrase are reused; everything derived
+# from the text itself is recomputed from the request's own text.
+SEMANTIC_CACHE_FIELDS = ('overall_sentiment', 'confidence', 'vader_scores', 'textblob_scores')
+semantic_cache = None
+if os.getenv('SEMANTIC_CACHE') == '1':
+    try:
+        semantic_cache = SemanticCache(
+            threshold=float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.86'))
+        )
+    except ImportError:
+        semantic_cache = None
+
+
+def analyze_texts(texts):
+    """
+    Analyze several texts, serving paraphrases of earlier texts from the
+    semantic cache when it is enabled. Exact repeats are always answered by
+    the analysis cache and never embedded.
+    
+    Args:
+        texts (list): The texts to analyze.
+        
+    Returns:
+        list: A private copy of the detailed analysis for each text, in order.
+    """
+    if semantic_cache is None:
+        return analyze_many(texts)
+    
+    results = [analysis_cache.get(text) for text in texts]
+    unseen = [i for i, cached in enumerate(results) if cached is None]
+    results = [copy.deepcopy(cached) for cached in results]
+    if not unseen:
+        return results
+    
+    # One embedding call for the texts without an exact cached result
+    embeddings = semantic_cache.embed([texts[i] for i in unseen])
+    
+    misses = []
+    for i, embedding in zip(unseen, embeddings):
+        cached = semantic_cache.get(embedding)
+        if cached is None:
+            misses.append((i, embedding))
+        else:
+            # Cached sentiment scores plus the fields of this request's text
+            analysis = copy.deepcopy(cached)
+            analysis.update(analyzer.get_text_analysis(texts[i]))
+            results[i] = analysis
+    
+    missed_texts = [texts[i] for i, _ in misses]
+    for (i, embedding), analysis in zip(misses, _analyze_shared(missed_texts)):
+        semantic_cache.put(embedding, {field: analysis[field] for field in SEMANTIC_CACHE_FIELDS})
+        results[i] = copy.deepcopy(analysis)
+    
+    return results
+
 
 def allowed_file(filename):
     """
@@ -38,13 +240,79 @@ def allowed_file(filename):
     Returns:
         bool: True if the file has an allowed extension, False otherwise.
     """
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(ALLOWED_EXTENSIONS)
+
+
+def read_text_file(file):
+    """
+    Decode an uploaded .txt file.
+    
+    A UTF-8 character is at most 4 bytes, so a file longer than
+    4 * MAX_TEXT_LENGTH bytes must exceed the limit and is rejected after a
+    single bounded read, without decoding anything.
+    
+    Args:
+        file (FileStorage): The uploaded file.
+        
+    Returns:
+        str: The file content, or None if it is certainly over the limit.
+    """
+    max_bytes = MAX_TEXT_LENGTH * 4
+    raw = file.stream.read(max_bytes + 1)
+    if len(raw) > max_bytes:
+        return None
+    return raw.decode('utf-8', errors='replace')
+
+
+# Content decoders by file extension (.pdf and .docx are accepted but not yet decoded)
+FILE_DECODERS = {
+    '.txt': read_text_file
+}
+
+# Analysis fields /api/stats needs when the client supplies a prior result
+STATS_ANALYSIS_FIELDS = frozenset({
+    'sentence_count', 'token_count', 'vader_scores', 'overall_sentiment', 'confidence'
+})
+
+# Numeric fields of a supplied analysis and of its vader_scores
+STATS_COUNT_FIELDS = ('sentence_count', 'token_count', 'confidence')
+STATS_VADER_FIELDS = ('positive', 'negative', 'neutral')
+
+
+def _is_number(value):
+    """Check that a JSON value is an int or float (booleans excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_stats_analysis(analysis):
+    """
+    Check that a client-supplied analysis has the shape /api/stats reads.
+    
+    Args:
+        analysis: The "analysis" value from the request JSON.
+        
+    Returns:
+        bool: True if every field used for the statistics is present and
+        well-typed, False otherwise.
+    """
+    if not isinstance(analysis, dict) or not STATS_ANALYSIS_FIELDS.issubset(analysis):
+        return False
+    vader_scores = analysis['vader_scores']
+    if not isinstance(vader_scores, dict):
+        return False
+    return (
+        isinstance(analysis['overall_sentiment'], str)
+        and all(_is_number(analysis[field]) for field in STATS_COUNT_FIELDS)
+        and all(_is_number(vader_scores.get(field)) for field in STATS_VADER_FIELDS)
+    )
 
 
 @app.route('/')
 def index():
-    """Serve the main HTML interface"""
-    return send_file('index.html')
+    """Serve the main HTML interface (cached in memory, supports conditional GET)"""
+    if request.if_none_match.contains(INDEX_ETAG):
+        return '', 304, INDEX_HEADERS
+    return Response(INDEX_BYTES, mimetype='text/html', headers=INDEX_HEADERS)
 
 
 @app.route('/api/health', methods=['GET'])
@@ -90,13 +358,13 @@ def analyze_text():
                 'error': 'Text field cannot be empty'
             }), 400
         
-        if len(text) > 50000:
+        if len(text) > MAX_TEXT_LENGTH:
             return jsonify({
-                'error': 'Text exceeds maximum length of 50000 characters'
+                'error': f'Text exceeds maximum length of {MAX_TEXT_LENGTH} characters'
             }), 400
         
         # Perform sentiment analysis
-        result = analyzer.get_detailed_analysis(text)
+        result = analyze_texts([text])[0]
         
         return jsonify({
             'success': True,
@@ -142,26 +410,26 @@ def analyze_file():
                 'error': 'File type not allowed. Allowed types: txt'
             }), 400
         
-        # Read file content
-        if file.filename.endswith('.txt'):
-            content = file.read().decode('utf-8')
-        else:
+        # Read file content with the decoder for its extension
+        decoder = FILE_DECODERS.get(os.path.splitext(file.filename.lower())[1])
+        if decoder is None:
             return jsonify({
                 'error': 'Currently only .txt files are supported'
             }), 400
+        content = decoder(file)
         
-        if len(content) > 50000: # Increased limit for larger files
+        if content is None or len(content) > MAX_TEXT_LENGTH:
             return jsonify({
-                'error': 'File content exceeds maximum length of 50000 characters'
+                'error': f'File content exceeds maximum length of {MAX_TEXT_LENGTH} characters'
             }), 400
         
         # Robust splitting logic
-        # Try double newline first (typical paragraph separation)
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+        # Try blank lines first (typical paragraph separation)
+        paragraphs = [p for p in (s.strip() for s in PARA_RE.split(content)) if p]
         
         # If only one paragraph found, check if it has single newlines and use those
         if len(paragraphs) <= 1:
-            split_by_single = [p.strip() for p in content.split('\n') if p.strip()]
+            split_by_single = [p for p in (s.strip() for s in LINE_RE.split(content)) if p]
             if len(split_by_single) > 1:
                 paragraphs = split_by_single
         
@@ -170,14 +438,15 @@ def analyze_file():
                 'error': 'No valid content found in file'
             }), 400
 
-        # Perform sentiment analysis for each paragraph
-        results = []
-        for p in paragraphs:
-            analysis = analyzer.get_detailed_analysis(p)
-            results.append({
+        # Perform sentiment analysis for each paragraph in parallel batches
+        analyses = analyze_many(paragraphs)
+        results = [
+            {
                 'text_preview': p[:100] + ('...' if len(p) > 100 else ''),
                 'analysis': analysis
-            })
+            }
+            for p, analysis in zip(paragraphs, analyses)
+        ]
         
         return jsonify({
             'success': True,
@@ -238,14 +507,15 @@ def analyze_batch():
                 'error': 'No valid texts provided'
             }), 400
         
-        # Perform batch analysis
-        results = []
-        for text in texts:
-            result = analyzer.get_detailed_analysis(text)
-            results.append({
+        # Perform batch analysis in parallel
+        analyses = analyze_texts(texts)
+        results = [
+            {
                 'text': text[:100] + ('...' if len(text) > 100 else ''),
                 'analysis': result
-            })
+            }
+            for text, result in zip(texts, analyses)
+        ]
         
         return jsonify({
             'success': True,
@@ -269,9 +539,15 @@ def get_stats():
     
     Request JSON:
     {
-        "text": "Your text here"
+        "text": "Your text here",
+        "analysis": {...}  (optional)
     }
     
+    "analysis" is the "data" object of an earlier /api/analyze response for
+    the same text. When supplied the text is not re-analyzed; only character
+    and word counts are computed from it. Without it the analysis comes from
+    the shared cache, so a call right after /api/analyze is still cheap.
+    
     Returns:
         JSON response containing the computed statistics.
     """
@@ -284,12 +560,24 @@ def get_stats():
             }), 400
         
         text = data['text'].strip()
-        result = analyzer.get_detailed_analysis(text)
+        analysis = data.get('analysis')
+        
+        if analysis is not None:
+            if not is_stats_analysis(analysis):
+                return jsonify({
+                    'error': 'analysis must be the data object of an /api/analyze response'
+                }), 400
+            result = analysis
+            word_count = len(text.split())
+        else:
+            # Read-only use, so the shared cache entry needs no copy
+            result = _analyze_shared([text])[0]
+            word_count = result['word_count']
         
         # Calculate statistics
         stats = {
             'character_count': len(text),
-            'word_count': len(text.split()),
+            'word_count': word_count,
             'sentence_count': result['sentence_count'],
             'token_count': result['token_count'],
             'sentiment_breakdown': {
@@ -329,5 +617,6 @@ def internal_error(error):
 
 
 if __name__ == '__main__':
-    # Run Flask app in debug mode
-    app.run(debug=True, host='127.0.0.1', port=5000)
+    # Development server only; debug mode is opt-in with FLASK_ENV=development.
+    # For production use gunicorn (see gunicorn.conf.py): gunicorn app:app
+    app.run(debug=os.getenv('FLASK_ENV') == 'development', host='127.0.0.1', port=5000)
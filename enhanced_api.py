@@ -8,20 +8,84 @@ This module demonstrates the enhancement of the Sentiment Analysis Application
 with RESTful API capabilities, security, and scalability features.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from functools import wraps
-from datetime import datetime, timedelta
+from datetime import timedelta
+from concurrent.futures import Future
+from collections import OrderedDict
+from urllib.parse import urlsplit
+from sentiment_analyzer import SentimentAnalyzer
+from json_provider import OrjsonProvider
+import asyncio
+import ipaddress
+import itertools
 import json
 import logging
+import os
+import queue
+import socket
+import threading
+import time
+import httpx
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Envelope timestamps have one-second resolution, so the formatted string is
+# rebuilt at most once per second. Stored as one tuple so readers never see
+# a second paired with another second's string.
+_TS_CACHE = (0, "", b"")
+
+
+def _cached_timestamp():
+    """Return (second, str, bytes) for the current UTC second"""
+    global _TS_CACHE
+    now = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] != now:
+        formatted = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))
+        cached = (now, formatted, formatted.encode('ascii'))
+        _TS_CACHE = cached
+    return cached
+
+
+def _utc_timestamp():
+    """Return the current UTC time as an ISO 8601 string (cached per second)"""
+    return _cached_timestamp()[1]
+
+
+_id_counter = itertools.count()
+
+
+def new_id(prefix):
+    """
+    Generate a unique, time-ordered identifier such as "req_1706700000000_42".
+    
+    The millisecond clock keeps IDs sortable; the counter suffix keeps IDs
+    created within the same millisecond distinct.
+    """
+    return f"{prefix}_{time.time_ns() // 1_000_000}_{next(_id_counter) & 0xffff}"
+
+
+# The success envelope always has the same shape, so it is rendered by
+# splicing pre-serialized values into a byte template instead of building
+# and encoding a dict per reply
+_SUCCESS_TEMPLATE = (
+    b'{"status":"success","code":%d,"message":%b,"data":%b,'
+    b'"error":null,"timestamp":"%b"}'
+)
+
+
+def _json_response(payload, status):
+    """Serialize payload with orjson into a JSON response"""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
 
 class APIResponse:
     """Standardized API Response Format"""
@@ -29,19 +93,23 @@ class APIResponse:
     @staticmethod
     def success(data, status_code=200, message="Success"):
         """Return standardized success response"""
-        return {
-            "status": "success",
-            "code": status_code,
-            "message": message,
-            "data": data,
-            "error": None,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }, status_code
+        return APIResponse.success_json(orjson.dumps(data), status_code, message)
+    
+    @staticmethod
+    def success_json(data_json, status_code=200, message="Success"):
+        """Return standardized success response for already serialized data"""
+        body = _SUCCESS_TEMPLATE % (
+            status_code,
+            orjson.dumps(message),
+            data_json,
+            _cached_timestamp()[2]
+        )
+        return Response(body, status=status_code, mimetype='application/json')
     
     @staticmethod
     def error(error_message, status_code=400, error_code="BAD_REQUEST"):
         """Return standardized error response"""
-        return {
+        return _json_response({
             "status": "error",
             "code": status_code,
             "error": {
@@ -49,8 +117,394 @@ class APIResponse:
                 "code": error_code
             },
             "data": None,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }, status_code
+            "timestamp": _utc_timestamp()
+        }, status_code)
+
+
+class WebhookDispatcher:
+    """
+    Delivers webhook notifications without blocking request workers.
+    
+    Flask runs each async view in a new event loop, so a pooled
+    httpx.AsyncClient cannot be shared between requests. The dispatcher
+    instead owns one event loop on a daemon thread with a single client and
+    connection pool; handlers schedule deliveries and return immediately.
+    """
+    
+    def __init__(self, max_concurrency=16, timeout=10.0):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._loop = None
+        self._client = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+    
+    def _get_loop(self):
+        """Start the delivery loop thread on first use"""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="webhook-dispatcher", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+    
+    async def _is_deliverable(self, url):
+        """Resolve the URL's host again at delivery time, as DNS may have changed since validation"""
+        target = webhook_target(url)
+        if target is None:
+            return False
+        addrinfo = await asyncio.get_running_loop().getaddrinfo(*target, type=socket.SOCK_STREAM)
+        return all_public_addresses(addrinfo)
+    
+    async def _post(self, url, body):
+        """POST one notification, bounded by the concurrency semaphore"""
+        if self._client is None:
+            # Created lazily so the client and semaphore bind to the delivery loop.
+            # Redirects are not followed: they could lead to a non-public host.
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency),
+                follow_redirects=False
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with self._semaphore:
+            try:
+                if not await self._is_deliverable(url):
+                    logger.warning(f"Webhook delivery to {url} refused: not a public http(s) host")
+                    return False
+                
+                response = await self._client.post(
+                    url, content=body, headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                return True
+            except Exception as e:
+                logger.warning(f"Webhook delivery to {url} failed: {str(e)}")
+                return False
+    
+    async def _deliver(self, urls, body):
+        """Send the same notification to every URL concurrently"""
+        return await asyncio.gather(*(self._post(url, body) for url in urls))
+    
+    def dispatch(self, urls, event, data):
+        """
+        Schedule an event notification for delivery.
+        
+        Args:
+            urls (list): Webhook URLs to notify.
+            event (str): Event name, e.g. "batch_completed".
+            data (dict): Event payload.
+            
+        Returns:
+            concurrent.futures.Future: Resolves to one success flag per URL.
+        """
+        body = orjson.dumps({"event": event, "data": data, "timestamp": _utc_timestamp()})
+        return asyncio.run_coroutine_threadsafe(self._deliver(list(urls), body), self._get_loop())
+
+
+webhooks = WebhookDispatcher()
+
+
+# Schemes allowed for webhook URLs and their default ports
+WEBHOOK_SCHEMES = {'http': 80, 'https': 443}
+
+
+def webhook_target(url):
+    """
+    Split a user-supplied webhook URL into the host and port it connects to.
+    
+    Args:
+        url: Value taken from the request body.
+        
+    Returns:
+        tuple: (host, port), or None if the URL is not an absolute http(s) URL.
+    """
+    if not isinstance(url, str):
+        return None
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    if parts.scheme not in WEBHOOK_SCHEMES or not parts.hostname:
+        return None
+    return parts.hostname, port or WEBHOOK_SCHEMES[parts.scheme]
+
+
+def all_public_addresses(addrinfo):
+    """
+    Check that every address a host resolved to is publicly routable.
+    
+    Loopback, private, link-local, reserved and multicast addresses are
+    rejected so clients cannot make the server call its own network.
+    
+    Args:
+        addrinfo (list): Result of socket.getaddrinfo for the host.
+        
+    Returns:
+        bool: True if there is at least one address and all are public.
+    """
+    if not addrinfo:
+        return False
+    for info in addrinfo:
+        # Drop any IPv6 scope id ("fe80::1%eth0") before parsing
+        address = ipaddress.ip_address(info[4][0].split('%', 1)[0])
+        if not address.is_global or address.is_multicast:
+            return False
+    return True
+
+
+def is_webhook_url(url):
+    """
+    Check that a user-supplied webhook URL is an http(s) URL on a public host.
+    
+    Args:
+        url: Value taken from the request body.
+        
+    Returns:
+        bool: True if the URL may be used for webhook delivery.
+    """
+    target = webhook_target(url)
+    if target is None:
+        return False
+    try:
+        return all_public_addresses(socket.getaddrinfo(*target, type=socket.SOCK_STREAM))
+    except (OSError, UnicodeError):
+        return False
+
+
+class BatchQueue:
+    """
+    Micro-batching work queue for sentiment analysis.
+    
+    Texts submitted by any request are collected by one background worker,
+    which takes up to max_batch queued items (waiting at most max_wait
+    seconds after the first) and analyzes them with a single
+    get_detailed_analysis_many call. Small requests arriving together thus
+    share one analyzer pass instead of each running on its own.
+    """
+    
+    def __init__(self, analyzer_factory, max_batch=32, max_wait=0.01):
+        self.analyzer_factory = analyzer_factory
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._analyzer = None
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+    
+    def submit(self, texts):
+        """
+        Queue texts for analysis.
+        
+        Args:
+            texts (list): Texts to analyze.
+            
+        Returns:
+            list: One concurrent.futures.Future per text, resolving to its analysis.
+        """
+        self._ensure_worker()
+        futures = []
+        for text in texts:
+            future = Future()
+            self._queue.put((text, future))
+            futures.append(future)
+        return futures
+    
+    def _ensure_worker(self):
+        """Start the worker thread on first use"""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="batch-queue", daemon=True)
+                self._worker.start()
+    
+    def _next_batch(self):
+        """Block for one item, then gather more until the batch is full or the window closes"""
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(items) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return items
+    
+    def _run(self):
+        """Worker loop: analyze each batch and resolve its futures"""
+        while True:
+            items = [item for item in self._next_batch() if item[1].set_running_or_notify_cancel()]
+            if not items:
+                continue
+            
+            try:
+                if self._analyzer is None:
+                    self._analyzer = self.analyzer_factory()
+                results = self._analyzer.get_detailed_analysis_many([text for text, _ in items])
+            except Exception as e:
+                logger.error(f"Batch analysis error: {str(e)}")
+                self._run_individually(items)
+            else:
+                for (_, future), result in zip(items, results):
+                    future.set_result(result)
+    
+    def _run_individually(self, items):
+        """Fallback after a failed batch: analyze items one by one so only bad ones fail"""
+        for text, future in items:
+            try:
+                if self._analyzer is None:
+                    self._analyzer = self.analyzer_factory()
+                future.set_result(self._analyzer.get_detailed_analysis_many([text])[0])
+            except Exception as e:
+                future.set_exception(e)
+
+
+batch_queue = BatchQueue(SentimentAnalyzer)
+
+# Longest text accepted for analysis, same limit as app.py
+MAX_TEXT_LENGTH = 50000
+
+# Largest request body accepted; room for a full batch of maximum-length texts
+MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+
+
+class BatchJobStore:
+    """
+    Thread-safe, bounded map from batch_id to batch job.
+    
+    Jobs expire ttl seconds after creation, and the oldest job is evicted once
+    max_jobs are held, so queued texts and their results can't accumulate.
+    Jobs live in the memory of the process that created them: when the
+    enhanced API runs under several worker processes, status and result
+    requests must reach the same process (one worker with threads, or sticky
+    routing), otherwise they get a 404.
+    """
+    
+    def __init__(self, max_jobs=1000, ttl=3600):
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _expire(self, now):
+        """Drop expired jobs; insertion order is creation order"""
+        while self._jobs:
+            job = next(iter(self._jobs.values()))
+            if now - job['created'] < self.ttl:
+                break
+            self._jobs.popitem(last=False)
+    
+    def add(self, job):
+        """Store a new job, evicting expired jobs and then the oldest when full"""
+        now = time.monotonic()
+        job['created'] = now
+        with self._lock:
+            self._expire(now)
+            self._jobs[job['batch_id']] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+    
+    def get(self, batch_id):
+        """Return the job for batch_id, or None if it is unknown or expired"""
+        with self._lock:
+            self._expire(time.monotonic())
+            return self._jobs.get(batch_id)
+    
+    def pop(self, batch_id):
+        """Remove and return the job for batch_id, or None"""
+        with self._lock:
+            return self._jobs.pop(batch_id, None)
+
+
+BATCH_JOBS = BatchJobStore()
+
+
+def _batch_status(job):
+    """Build the status payload for a batch job from its item futures"""
+    total = len(job['futures'])
+    completed = sum(1 for future in job['futures'] if future.done())
+    return {
+        "batch_id": job['batch_id'],
+        "status": "completed" if completed == total else "processing",
+        "progress": completed * 100 // total if total else 100,
+        "total_items": total,
+        "completed_items": completed,
+        "metadata": job['metadata'],
+        "results_url": job['results_url']
+    }
+
+
+def _track_batch(job):
+    """Log completion and notify the job's callback URL once every item is done"""
+    lock = threading.Lock()
+    pending = [len(job['futures'])]
+    
+    def finish():
+        logger.info(f"Batch job completed: {job['batch_id']}")
+        if job['callback_url']:
+            webhooks.dispatch([job['callback_url']], "batch_completed", _batch_status(job))
+    
+    def on_item_done(_):
+        with lock:
+            pending[0] -= 1
+            done = pending[0] == 0
+        if done:
+            finish()
+    
+    if not job['futures']:
+        finish()
+    for future in job['futures']:
+        future.add_done_callback(on_item_done)
+
+
+# Static model catalogue served by the model management endpoints
+MODELS = [
+    {
+        "id": "vader",
+        "name": "VADER Sentiment Analyzer",
+        "description": "Valence Aware Dictionary and sEntiment Reasoner",
+        "language": "en",
+        "accuracy": 0.88,
+        "type": "lexicon-based",
+        "supported_tasks": ["sentiment_analysis", "intensity_detection"]
+    },
+    {
+        "id": "textblob",
+        "name": "TextBlob Sentiment",
+        "description": "Simple API for common NLP tasks",
+        "language": "en",
+        "accuracy": 0.82,
+        "type": "machine-learning",
+        "supported_tasks": ["sentiment_analysis", "subjectivity_detection"]
+    },
+    {
+        "id": "bert-sentiment",
+        "name": "BERT Sentiment (Coming Soon)",
+        "description": "Transformer-based deep learning model",
+        "language": "en",
+        "accuracy": 0.94,
+        "type": "deep-learning",
+        "status": "coming_soon",
+        "supported_tasks": ["sentiment_analysis", "aspect_sentiment"]
+    }
+]
+_MODELS_JSON = orjson.dumps({"models": MODELS})
+
+
+# Rate limit counters live in Redis so every worker and node shares them.
+# Apps can override any of these through the factory config, e.g.
+# RATELIMIT_STORAGE_URI="memory://" for tests.
+RATELIMIT_CONFIG = {
+    'RATELIMIT_STORAGE_URI': os.getenv('RATELIMIT_STORAGE_URI', 'redis://localhost:6379/0'),
+    'RATELIMIT_STORAGE_OPTIONS': {'max_connections': 32},
+    'RATELIMIT_STRATEGY': 'moving-window',
+    'RATELIMIT_IN_MEMORY_FALLBACK_ENABLED': True
+}
 
 
 def enhanced_app_factory(config=None):
@@ -67,6 +521,7 @@ def enhanced_app_factory(config=None):
     """
     
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Configuration
     if config is None:
@@ -76,11 +531,15 @@ def enhanced_app_factory(config=None):
             'JSON_SORT_KEYS': False
         }
     
+    app.config.update(RATELIMIT_CONFIG)
+    app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
     app.config.update(config)
+    app.json.sort_keys = app.config.get('JSON_SORT_KEYS', True)
     
     # Initialize extensions
     CORS(app)
     JWTManager(app)
+    # One limiter per app, so each app keeps the storage from its own config
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,
@@ -127,13 +586,13 @@ def enhanced_app_factory(config=None):
             
             # In production: Hash password and store in database
             # For demo: Generate dummy API key
-            api_key = f"sk_{data['username'][:3]}_{int(datetime.utcnow().timestamp())}"
+            api_key = new_id(f"sk_{data['username'][:3]}")
             
             response_data = {
                 "user_id": "user_123",
                 "username": data['username'],
                 "api_key": api_key,
-                "created_at": datetime.utcnow().isoformat() + "Z"
+                "created_at": _utc_timestamp()
             }
             
             logger.info(f"New user registered: {data['username']}")
@@ -253,7 +712,7 @@ def enhanced_app_factory(config=None):
                 )
             
             # Generate request ID for tracking
-            request_id = f"req_{int(datetime.utcnow().timestamp() * 1000)}"
+            request_id = new_id("req")
             
             # Perform sentiment analysis (using analyzer module)
             # sentiment_result = analyzer.get_detailed_analysis(text)
@@ -274,7 +733,7 @@ def enhanced_app_factory(config=None):
                 "request_id": request_id,
                 "sentiment": sentiment_result['overall_sentiment'],
                 "confidence": sentiment_result['confidence'],
-                "processed_at": datetime.utcnow().isoformat() + "Z",
+                "processed_at": _utc_timestamp(),
                 "text_preview": text[:100] + ("..." if len(text) > 100 else "")
             }
             
@@ -316,7 +775,9 @@ def enhanced_app_factory(config=None):
             }
         }
         
-        Note: Simulates queuing a batch job without actual background processing.
+        Texts are analyzed in the background by the shared batch queue; poll
+        the processing_url for progress or pass callback_url to be notified
+        with a batch_completed event.
         """
         try:
             data = request.get_json()
@@ -337,23 +798,51 @@ def enhanced_app_factory(config=None):
                     400, "VALIDATION_ERROR"
                 )
             
+            if not all(isinstance(text, str) for text in texts):
+                return APIResponse.error(
+                    "texts must contain only strings",
+                    400, "VALIDATION_ERROR"
+                )
+            
+            if any(len(text) > MAX_TEXT_LENGTH for text in texts):
+                return APIResponse.error(
+                    f"Each text must be at most {MAX_TEXT_LENGTH} characters",
+                    400, "VALIDATION_ERROR"
+                )
+            
+            if callback_url is not None and not is_webhook_url(callback_url):
+                return APIResponse.error(
+                    "callback_url must be an http or https URL on a public host",
+                    400, "VALIDATION_ERROR"
+                )
+            
             # Generate batch ID
-            batch_id = f"batch_{int(datetime.utcnow().timestamp() * 1000)}"
+            batch_id = new_id("batch")
             
             response_data = {
                 "batch_id": batch_id,
                 "status": "queued",
                 "total_items": len(texts),
                 "processing_url": f"/api/{API_VERSION}/sentiment/batch/{batch_id}",
-                "created_at": datetime.utcnow().isoformat() + "Z"
+                "created_at": _utc_timestamp()
             }
             
             if callback_url:
                 response_data['webhook_url'] = callback_url
+                webhooks.dispatch([callback_url], "batch_queued", response_data)
             
-            logger.info(f"Batch job created: {batch_id} with {len(texts)} items")
+            job = {
+                "batch_id": batch_id,
+                "texts": texts,
+                "futures": batch_queue.submit(texts),
+                "callback_url": callback_url,
+                "metadata": metadata,
+                "results_url": f"/api/{API_VERSION}/sentiment/batch/{batch_id}/results"
+            }
+            BATCH_JOBS.add(job)
+            _track_batch(job)
             
-            # In production: Queue job with Celery/RQ and process asynchronously
+            logger.info(f"Batch job created: {batch_id} with {len(texts)} items")
             return APIResponse.success(response_data, 202, "Batch job queued")
         
         except Exception as e:
@@ -379,20 +868,18 @@ def enhanced_app_factory(config=None):
             }
         }
         
-        Note: Always returns a mocking 'completed' status.
+        Status is "processing" until every item has been analyzed. Jobs are
+        forgotten once their results have been fetched or after an hour.
         """
         try:
-            # In production: Fetch job status from queue/database
-            response_data = {
-                "batch_id": batch_id,
-                "status": "completed",
-                "progress": 100,
-                "total_items": 2,
-                "completed_items": 2,
-                "results_url": f"/api/{API_VERSION}/sentiment/batch/{batch_id}/results"
-            }
+            job = BATCH_JOBS.get(batch_id)
+            if job is None:
+                return APIResponse.error(
+                    "Batch job not found",
+                    404, "BATCH_NOT_FOUND"
+                )
             
-            return APIResponse.success(response_data, 200, "Batch status retrieved")
+            return APIResponse.success(_batch_status(job), 200, "Batch status retrieved")
         
         except Exception as e:
             logger.error(f"Status check error: {str(e)}")
@@ -401,6 +888,64 @@ def enhanced_app_factory(config=None):
                 500, "STATUS_ERROR"
             )
     
+    @app.route(f'/api/{API_VERSION}/sentiment/batch/<batch_id>/results', methods=['GET'])
+    @jwt_required()
+    def get_batch_results(batch_id):
+        """
+        Get the analysis results of a completed batch job.
+        
+        Response:
+        {
+            "status": "success",
+            "data": {
+                "batch_id": "batch_123",
+                "results": [
+                    {"text_preview": "...", "analysis": {...}},
+                    {"text_preview": "...", "error": "..."}
+                ]
+            }
+        }
+        
+        Results can be fetched once; the job is removed afterwards.
+        """
+        try:
+            job = BATCH_JOBS.get(batch_id)
+            if job is None:
+                return APIResponse.error(
+                    "Batch job not found",
+                    404, "BATCH_NOT_FOUND"
+                )
+            
+            if not all(future.done() for future in job['futures']):
+                return APIResponse.error(
+                    "Batch job is still processing",
+                    409, "BATCH_NOT_READY"
+                )
+            
+            results = []
+            for text, future in zip(job['texts'], job['futures']):
+                item = {"text_preview": text[:100] + ("..." if len(text) > 100 else "")}
+                if future.exception() is not None:
+                    item['error'] = str(future.exception())
+                else:
+                    item['analysis'] = future.result()
+                results.append(item)
+            
+            response_data = {
+                "batch_id": batch_id,
+                "results": results
+            }
+            
+            BATCH_JOBS.pop(batch_id)
+            return APIResponse.success(response_data, 200, "Batch results retrieved")
+        
+        except Exception as e:
+            logger.error(f"Results retrieval error: {str(e)}")
+            return APIResponse.error(
+                "Results retrieval failed",
+                500, "RESULTS_ERROR"
+            )
+    
     # ==================== Model Management Endpoints ====================
     
     @app.route(f'/api/{API_VERSION}/models/list', methods=['GET'])
@@ -419,38 +964,7 @@ def enhanced_app_factory(config=None):
         
         Note: Returns a static list of models for demonstration.
         """
-        models = [
-            {
-                "id": "vader",
-                "name": "VADER Sentiment Analyzer",
-                "description": "Valence Aware Dictionary and sEntiment Reasoner",
-                "language": "en",
-                "accuracy": 0.88,
-                "type": "lexicon-based",
-                "supported_tasks": ["sentiment_analysis", "intensity_detection"]
-            },
-            {
-                "id": "textblob",
-                "name": "TextBlob Sentiment",
-                "description": "Simple API for common NLP tasks",
-                "language": "en",
-                "accuracy": 0.82,
-                "type": "machine-learning",
-                "supported_tasks": ["sentiment_analysis", "subjectivity_detection"]
-            },
-            {
-                "id": "bert-sentiment",
-                "name": "BERT Sentiment (Coming Soon)",
-                "description": "Transformer-based deep learning model",
-                "language": "en",
-                "accuracy": 0.94,
-                "type": "deep-learning",
-                "status": "coming_soon",
-                "supported_tasks": ["sentiment_analysis", "aspect_sentiment"]
-            }
-        ]
-        
-        return APIResponse.success({"models": models}, 200, "Models retrieved successfully")
+        return APIResponse.success_json(_MODELS_JSON, 200, "Models retrieved successfully")
     
     @app.route(f'/api/{API_VERSION}/models/<model_id>/info', methods=['GET'])
     @jwt_required()
@@ -531,14 +1045,20 @@ def enhanced_app_factory(config=None):
                     400, "VALIDATION_ERROR"
                 )
             
-            webhook_id = f"wh_{int(datetime.utcnow().timestamp() * 1000)}"
+            if not is_webhook_url(data['url']):
+                return APIResponse.error(
+                    "Webhook URL must be an http or https URL on a public host",
+                    400, "VALIDATION_ERROR"
+                )
+            
+            webhook_id = new_id("wh")
             
             response_data = {
                 "webhook_id": webhook_id,
                 "url": data['url'],
                 "events": data.get('events', ['all']),
                 "active": data.get('active', True),
-                "created_at": datetime.utcnow().isoformat() + "Z"
+                "created_at": _utc_timestamp()
             }
             
             logger.info(f"Webhook registered: {webhook_id}")
@@ -569,6 +1089,16 @@ def enhanced_app_factory(config=None):
             500, "INTERNAL_ERROR"
         )
     
+    @app.before_request
+    def reject_oversized_body():
+        """Reject oversized bodies up front, before handlers try to parse them"""
+        max_length = app.config.get('MAX_CONTENT_LENGTH')
+        if max_length is not None and (request.content_length or 0) > max_length:
+            return APIResponse.error(
+                "Request body too large",
+                413, "PAYLOAD_TOO_LARGE"
+            )
+    
     @app.errorhandler(429)
     def ratelimit_handler(e):
         """Handle rate limit errors"""
@@ -588,4 +1118,4 @@ if __name__ == '__main__':
     }
     
     app = enhanced_app_factory(config)
-    app.run(debug=True, host='127.0.0.1', port=5000)
+    app.run(debug=os.getenv('FLASK_ENV') == 'development', host='127.0.0.1', port=5000)
@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for production deployment
+Usage: gunicorn app:app  (this file is picked up automatically)
+
+Equivalent to: gunicorn -w $(nproc) -k gthread --threads 8 --preload app:app
+"""
+
+import multiprocessing
+import sys
+
+bind = "127.0.0.1:5000"
+workers = multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = 8
+
+# Import the app (and load the NLTK/TextBlob models) once in the master so
+# workers share those pages copy-on-write instead of each loading its own
+preload_app = True
+
+
+def when_ready(server):
+    """
+    Finish the analyzer warmup in the master before any worker is forked.
+    
+    Only applies when the preloaded app is app.py; other apps served with
+    this config (e.g. enhanced_api) must not import it. Each worker's thread
+    pool is recreated by app.py itself after fork.
+    """
+    app = sys.modules.get('app')
+    if app is not None and hasattr(app, 'WARMUP'):
+        app.WARMUP.result()
@@ -0,0 +1,38 @@
+"""
+orjson-backed JSON provider shared by the Flask applications
+Used for request.get_json() parsing and jsonify() responses
+"""
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider that parses and serializes with orjson.
+    
+    Install on an app with ``app.json = OrjsonProvider(app)``.
+    """
+    
+    sort_keys = True
+    """Sort dict keys in output, matching Flask's default provider."""
+    
+    def _options(self):
+        """orjson option flags for the current settings"""
+        return orjson.OPT_SORT_KEYS if self.sort_keys else 0
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, option=self._options()).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON str or bytes document"""
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Serialize the arguments straight to bytes and wrap them in a JSON response"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self._options()),
+            mimetype='application/json'
+        )
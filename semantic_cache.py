@@ -0,0 +1,113 @@
+"""
+Semantic (near-duplicate) cache for sentiment analysis results
+Reuses the analysis of a previously seen text whose sentence embedding is
+close enough to the new text, so paraphrased inputs skip the full analyzer.
+"""
+
+import itertools
+import threading
+
+
+class SemanticCache:
+    """
+    Centroid cache keyed by sentence embeddings.
+    
+    Each entry holds a unit-length centroid vector and the analysis computed
+    for the first text of its cluster. A lookup embeds the text, finds the most
+    similar centroid by inner product (cosine, since vectors are normalized)
+    and returns its analysis when the similarity reaches the threshold.
+    Requires the optional sentence-transformers package.
+    """
+    
+    def __init__(self, model_name='paraphrase-albert-small-v2', threshold=0.86, max_entries=1024):
+        """
+        Load the embedding model and allocate an empty centroid table.
+        
+        Args:
+            model_name (str): sentence-transformers model used for embeddings.
+            threshold (float): Minimum cosine similarity counted as a hit.
+            max_entries (int): Number of centroids kept before LRU eviction.
+        """
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+        
+        self._np = np
+        self.model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        
+        dim = self.model.get_sentence_embedding_dimension()
+        self.centroids = np.zeros((max_entries, dim), dtype=np.float32)
+        self.members = [0] * max_entries
+        self.analyses = [None] * max_entries
+        self.last_used = [0] * max_entries
+        self.size = 0
+        self._clock = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def embed(self, texts):
+        """
+        Embed several texts in a single model call.
+        
+        Args:
+            texts (list): Texts to embed.
+            
+        Returns:
+            numpy.ndarray: One unit-length row per text.
+        """
+        return self.model.encode(texts, normalize_embeddings=True, convert_to_numpy=True)
+    
+    def _nearest(self, embedding):
+        """Return (slot, similarity) of the closest centroid, or (-1, 0.0) when empty."""
+        if self.size == 0:
+            return -1, 0.0
+        similarities = self.centroids[:self.size] @ embedding
+        slot = int(similarities.argmax())
+        return slot, float(similarities[slot])
+    
+    def get(self, embedding):
+        """
+        Look up the analysis of the closest cached cluster.
+        
+        On a hit the cluster centroid is moved towards the new embedding by an
+        online mean, so the cluster tracks all texts it has served.
+        
+        Args:
+            embedding (numpy.ndarray): Unit-length embedding of the text.
+            
+        Returns:
+            dict or None: The cached sentiment fields (shared, do not mutate) or None on a miss.
+        """
+        with self._lock:
+            slot, similarity = self._nearest(embedding)
+            if slot < 0 or similarity < self.threshold:
+                return None
+            
+            self.members[slot] += 1
+            centroid = self.centroids[slot]
+            centroid += (embedding - centroid) / self.members[slot]
+            centroid /= self._np.linalg.norm(centroid)
+            self.last_used[slot] = next(self._clock)
+            return self.analyses[slot]
+    
+    def put(self, embedding, analysis):
+        """
+        Store the analysis of a text that missed the cache as a new cluster.
+        
+        When the table is full the least recently used cluster is replaced.
+        
+        Args:
+            embedding (numpy.ndarray): Unit-length embedding of the text.
+            analysis (dict): Sentiment fields of the analysis (no text-derived fields).
+        """
+        with self._lock:
+            if self.size < self.max_entries:
+                slot = self.size
+                self.size += 1
+            else:
+                slot = min(range(self.size), key=self.last_used.__getitem__)
+            
+            self.centroids[slot] = embedding
+            self.members[slot] = 1
+            self.analyses[slot] = analysis
+            self.last_used[slot] = next(self._clock)
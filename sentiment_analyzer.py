@@ -7,38 +7,322 @@ Description: This module provides sentiment analysis functionality using NLTK an
 
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import word_tokenize, sent_tokenize
+from nltk.tokenize import sent_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import copy
+import functools
+import os
 import re
 import string
+import threading
+
+# Required NLTK data as (resource path, package name) pairs
+NLTK_RESOURCES = (
+    ('sentiment/vader_lexicon', 'vader_lexicon'),
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords'),
+    ('corpora/wordnet', 'wordnet'),
+    ('taggers/averaged_perceptron_tagger', 'averaged_perceptron_tagger'),
+)
+
+
+def _ensure_nltk_data():
+    """
+    Download any missing NLTK data. Once everything is present a sentinel
+    file is written so later imports skip probing the NLTK search path.
+    """
+    sentinel = Path(nltk.data.path[0]) / '.downloaded'
+    if sentinel.exists():
+        return
+    
+    complete = True
+    for resource, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            complete = nltk.download(package, quiet=True) and complete
+    
+    if complete:
+        try:
+            sentinel.parent.mkdir(parents=True, exist_ok=True)
+            sentinel.touch()
+        except OSError:
+            pass
+
 
 # Download required NLTK data
-try:
-    nltk.data.find('sentiment/vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
+_ensure_nltk_data()
 
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# TextBlob parses its sentiment lexicon lazily on first use; do it at import
+# so the first request doesn't pay for it
+pattern_sentiment('warm up')
 
 try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
-try:
-    nltk.data.find('averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger')
+# Strong negative phrases that VADER often misses or underweights
+STRONG_NEGATIVE_PHRASES = (
+    # Direct negative expressions
+    'rubbish', 'utter rubbish', 'complete rubbish', 'total rubbish',
+    'hopeless', 'completely hopeless', 'utterly hopeless',
+    'waste of', 'waste of time', 'waste of money', 'waste of film',
+    'terrible', 'horrible', 'awful', 'dreadful', 'atrocious',
+    'error of judgment', 'huge error', 'big mistake', 'disaster',
+    'pathetic', 'abysmal', 'appalling', 'disgraceful',
+    'should hand in', 'should resign', 'should quit',
+    'unacceptable', 'inexcusable', 'unforgivable',
+    # Disappointment expressions  
+    'disappointing', 'disappointed', 'disappointment', 
+    'bitterly disappointing', 'hugely disappointing', 'let down', 'letdown',
+    'to my disappointment', 'what a disappointment',
+    # Review-specific negative phrases
+    'sad sight', 'bad imitation', 'poor imitation',
+    'pretty weak', 'very weak', 'quite weak', 'weak storyline', 'weak plot',
+    'not very good', 'not that good', 'not so good', 'isnt that good',
+    'didn\'t laugh', 'didnt laugh', 'never laughed',
+    'boring', 'tedious', 'dull', 'bland', 'mediocre', 'forgettable',
+    'wouldn\'t recommend', 'would not recommend', 'cannot recommend',
+    'don\'t bother', 'dont bother', 'skip this', 'avoid this',
+    'not worth', 'waste your time', 'save your money',
+    'fails to', 'failed to', 'lacks', 'lacking',
+    # Comparative negatives
+    'worse than', 'inferior to', 'pales in comparison',
+    'nothing like', 'far from', 'falls short'
+)
+
+# Strong positive phrases (only if NOT preceded by "hoping for", "expected", etc.)
+STRONG_POSITIVE_PHRASES = (
+    'excellent', 'outstanding', 'brilliant', 'fantastic', 'amazing',
+    'masterpiece', 'incredible', 'superb', 'phenomenal', 'extraordinary',
+    'highly recommend', 'must see', 'must watch', 'loved it', 'love it',
+    'best ever', 'best movie', 'best film', 'thoroughly enjoyed',
+    'blown away', 'exceeded expectations', 'pleasantly surprised'
+)
+
+# Phrases that indicate positive words are being used hypothetically/negatively
+# (e.g., "I was hoping for excellent" means they DIDN'T get excellent)
+HOPE_DISAPPOINTMENT_PATTERNS = (
+    'hoping', 'hoped', 'expected', 'expecting', 'wanted', 
+    'wished', 'thought it would', 'should have been',
+    'could have been', 'was supposed to'
+)
+
+NEGATIVE_PHRASE_SET = frozenset(STRONG_NEGATIVE_PHRASES)
+POSITIVE_PHRASE_SET = frozenset(STRONG_POSITIVE_PHRASES)
+HOPE_PATTERN_SET = frozenset(HOPE_DISAPPOINTMENT_PATTERNS)
+ALL_PHRASES = NEGATIVE_PHRASE_SET | POSITIVE_PHRASE_SET | HOPE_PATTERN_SET
+
+
+def _build_phrase_matcher():
+    """
+    Compile every keyword phrase into a single matcher so a text is scanned
+    once instead of once per phrase
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    one regex alternation. The regex is wrapped in a lookahead so matches may
+    overlap, and tries longer phrases first; phrases that are prefixes of the
+    longest match at a position (e.g. 'waste of' inside 'waste of time') are
+    added from a precomputed prefix map.
+    
+    Returns:
+        callable: Maps lowercased text to the set of phrases it contains
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for phrase in ALL_PHRASES:
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        
+        def find_phrases(text_lower):
+            return {phrase for _, phrase in automaton.iter(text_lower)}
+        
+        return find_phrases
+    
+    phrases = sorted(ALL_PHRASES, key=lambda phrase: (-len(phrase), phrase))
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, phrases)) + '))')
+    prefixes = {
+        phrase: frozenset(other for other in phrases if phrase.startswith(other))
+        for phrase in phrases
+    }
+    
+    def find_phrases(text_lower):
+        found = set()
+        for phrase in set(pattern.findall(text_lower)):
+            found |= prefixes[phrase]
+        return found
+    
+    return find_phrases
+
+
+find_phrases = _build_phrase_matcher()
+
+# URLs, email addresses and special characters/digits, removed in one pass.
+# The email branch may not run into a URL so that 'foohttp://a@b' loses only
+# the URL, matching the old URL-then-email substitution order.
+_PREPROCESS_RE = re.compile(
+    r'http\S+|www\S+|https\S+'
+    r'|(?:(?!http\S|www\S)\S)+@(?:(?!http\S|www\S)\S)+'
+    r'|[^a-zA-Z\s!?.]'
+)
+_WS_RE = re.compile(r'\s+')
+
+# Text made only of whitespace and sentence punctuation carries no sentiment:
+# no VADER or TextBlob lexicon entry, emoticon or keyword phrase can match it
+_TRIVIAL_RE = re.compile(r'[\s.,!?]*')
+
+# Cleaned text only holds lowercase letters, whitespace and !?. so words are
+# plain letter runs
+_WORD_RE = re.compile(r'[a-z]+')
+
+# spaCy's rule-based sentencizer replaces NLTK's Punkt only when explicitly
+# requested, since it may place some sentence boundaries differently
+if os.getenv('SENTENCE_SPLITTER', 'punkt').lower() == 'spacy':
+    import spacy
+    _sentencizer = spacy.blank('en')
+    _sentencizer.add_pipe('sentencizer')
+else:
+    _sentencizer = None
+
+
+def split_sentences(text):
+    """
+    Split text into sentences using NLTK's Punkt tokenizer, or spaCy's
+    sentencizer when SENTENCE_SPLITTER=spacy
+    
+    Args:
+        text (str): Input text
+        
+    Returns:
+        list: Sentence strings
+    """
+    if _sentencizer is None:
+        return sent_tokenize(text)
+    return [sent.text.strip() for sent in _sentencizer(text).sents if sent.text.strip()]
+
+
+def split_sentences_many(texts):
+    """
+    Split several texts into sentences in one pass, with the same result as
+    calling split_sentences on each. Punkt is loaded once for the batch
+    rather than once per text; spaCy processes the batch with nlp.pipe.
+    
+    Args:
+        texts (list): Input texts
+        
+    Returns:
+        list: One list of sentence strings per text
+    """
+    if _sentencizer is None:
+        tokenize = nltk.data.load('tokenizers/punkt/english.pickle').tokenize
+        return [tokenize(text) for text in texts]
+    return [
+        [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+        for doc in _sentencizer.pipe(texts)
+    ]
+
+
+# Longest text whose VADER/TextBlob scores are cached per analyzer. Sentences
+# repeat across documents; whole documents are cached (once) by the app.
+MAX_CACHED_TEXT_LENGTH = 1000
+
+# Overall sentiment labels indexed by _score_core's sentiment id
+SENTIMENT_LABELS = ('negative', 'neutral', 'positive')
+
+
+# Explicit signature: compiled once at import, never re-specialised per call
+@njit('Tuple((int64, float64))(float64, float64, int64, int64, float64, float64, int64, int64)',
+      cache=True)
+def _score_core(compound, polarity, positive_count, negative_count,
+                positive_intensity_sum, negative_intensity_sum,
+                positive_keyword_count, negative_keyword_count):
+    """
+    Numeric core of classify_overall_sentiment, kept to plain scalars so
+    Numba can compile it. Callers pass floats and ints exactly as typed in
+    the signature above.
+    
+    Returns:
+        tuple: (index into SENTIMENT_LABELS, unrounded confidence)
+    """
+    # Calculate keyword adjustment (-0.3 to +0.3 range)
+    keyword_adjustment = 0
+    if negative_keyword_count > positive_keyword_count:
+        keyword_adjustment = -0.1 * min(negative_keyword_count, 3)  # Cap at -0.3
+    elif positive_keyword_count > negative_keyword_count:
+        keyword_adjustment = 0.1 * min(positive_keyword_count, 3)   # Cap at +0.3
+    
+    # Normalize sentence distribution to -1 to 1 scale
+    if positive_count + negative_count > 0:
+        sentence_balance = (positive_count - negative_count) / (positive_count + negative_count)
+    else:
+        sentence_balance = 0
+    
+    # Calculate average intensity for each sentiment type
+    avg_negative_intensity = negative_intensity_sum / negative_count if negative_count > 0 else 0
+    avg_positive_intensity = positive_intensity_sum / positive_count if positive_count > 0 else 0
+    
+    # Intensity adjustment: Strong negative sentences should weigh more heavily
+    intensity_adjustment = 0
+    if avg_negative_intensity > 0.5 and negative_count >= 2:
+        intensity_adjustment = -0.15 * (avg_negative_intensity - 0.5)
+    elif avg_positive_intensity > 0.5 and positive_count >= 2:
+        intensity_adjustment = 0.15 * (avg_positive_intensity - 0.5)
+    
+    # Combined weighted score with keyword adjustment
+    combined_score = (
+        compound * 0.30 +              # VADER compound (30%)
+        polarity * 0.15 +              # TextBlob polarity (15%)
+        sentence_balance * 0.25 +       # Sentence distribution (25%)
+        keyword_adjustment +            # Keyword-based adjustment
+        intensity_adjustment +
+        # Bonus weight for TextBlob when VADER and TextBlob disagree
+        (polarity * 0.10 if (compound > 0 and polarity < 0) or (compound < 0 and polarity > 0) else 0)
+    )
+    
+    # Classification with adjusted thresholds
+    if combined_score >= 0.12:
+        sentiment_id = 2
+    elif combined_score <= -0.08:
+        sentiment_id = 0
+    else:
+        # For borderline cases, keyword detection takes priority
+        if negative_keyword_count > positive_keyword_count:
+            sentiment_id = 0
+        elif positive_keyword_count > negative_keyword_count:
+            sentiment_id = 2
+        # Then check sentence distribution
+        elif negative_count > positive_count and avg_negative_intensity > 0.3:
+            sentiment_id = 0
+        elif positive_count > negative_count and avg_positive_intensity > 0.3:
+            sentiment_id = 2
+        else:
+            sentiment_id = 1
+    
+    # Calculate confidence
+    confidence = abs(combined_score)
+    # Boost confidence if keyword detection found strong signals
+    if negative_keyword_count >= 2 or positive_keyword_count >= 2:
+        confidence = min(confidence + 0.2, 1.0)
+    # Boost confidence if multiple signals agree
+    if (compound > 0 and polarity > 0 and sentence_balance > 0) or \
+       (compound < 0 and polarity < 0 and sentence_balance < 0):
+        confidence = min(confidence * 1.2, 1.0)
+    
+    return sentiment_id, confidence
 
 
 class SentimentAnalyzer:
@@ -47,13 +331,38 @@ class SentimentAnalyzer:
     including VADER (Valence Aware Dictionary and sEntiment Reasoner) and TextBlob
     """
     
+    # NLTK models are loaded once and shared by every instance
+    _sia = None
+    _lemmatizer = None
+    _stop_words = None
+    _models_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the sentiment analyzer with necessary NLTK models"""
-        self.sia = SentimentIntensityAnalyzer()
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+        cls = type(self)
+        with cls._models_lock:
+            if cls._sia is None:
+                cls._lemmatizer = WordNetLemmatizer()
+                cls._stop_words = frozenset(stopwords.words('english'))
+                cls._sia = SentimentIntensityAnalyzer()
+        self.sia, self.lemmatizer, self.stop_words = cls._sia, cls._lemmatizer, cls._stop_words
+        
+        # Per-instance LRU caches for sentence-sized texts (see
+        # MAX_CACHED_TEXT_LENGTH). Scores are rounded once, before caching, so
+        # repeated sentences skip rounding too. Cached values are never handed
+        # out directly, so callers can't mutate them. Full results are cached
+        # by the app.
+        self._vader_cache = functools.lru_cache(maxsize=4096)(self._rounded_vader_scores)
+        self._textblob_cache = functools.lru_cache(maxsize=4096)(self._rounded_textblob_scores)
+        # Punctuation-only inputs are few and repetitive, so their sentence
+        # splits are cached (lists are copied before use)
+        self._trivial_split_cache = functools.lru_cache(maxsize=1024)(
+            lambda text: tuple(split_sentences(text))
+        )
+        # Word frequencies are Zipfian, so a token-level cache skips most WordNet lookups
+        self._lemmatize = functools.lru_cache(maxsize=50_000)(self.lemmatizer.lemmatize)
     
-    def preprocess_text(self, text):
+    def preprocess_text(self, text, text_lower=None):
         """
         Preprocess the input text by:
         1. Converting to lowercase
@@ -64,50 +373,60 @@ class SentimentAnalyzer:
         
         Args:
             text (str): Raw input text
+            text_lower (str): Optional precomputed text.lower()
             
         Returns:
             list: Processed tokens
             str: Cleaned text for analysis
         """
         # Convert to lowercase
-        text_lower = text.lower()
-        
-        # Remove URLs
-        text_cleaned = re.sub(r'http\S+|www\S+|https\S+', '', text_lower, flags=re.MULTILINE)
-        
-        # Remove email addresses
-        text_cleaned = re.sub(r'\S+@\S+', '', text_cleaned)
-        
-        # Remove special characters and digits (but keep important punctuation)
-        text_cleaned = re.sub(r'[^a-zA-Z\s!?.]', '', text_cleaned)
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Remove extra whitespace
-        text_cleaned = ' '.join(text_cleaned.split())
+        # Remove URLs, email addresses, special characters and digits (but keep
+        # important punctuation), then collapse extra whitespace
+        text_cleaned = _WS_RE.sub(' ', _PREPROCESS_RE.sub('', text_lower)).strip()
         
         # Tokenization
-        tokens = word_tokenize(text_cleaned)
+        tokens = _WORD_RE.findall(text_cleaned)
         
-        # Remove stopwords and lemmatize
+        # Remove stopwords and lemmatize (tokens are already lowercase)
+        lemmatize = self._lemmatize
+        stop_words = self.stop_words
         processed_tokens = [
-            self.lemmatizer.lemmatize(token) 
-            for token in tokens 
-            if token.lower() not in self.stop_words and len(token) > 2
+            lemmatize(token)
+            for token in tokens
+            if token not in stop_words and len(token) > 2
         ]
         
         return processed_tokens, text_cleaned
     
-    def analyze_sentiment_vader(self, text):
+    def _polarity_scores(self, text):
         """
-        Analyze sentiment using VADER (Valence Aware Dictionary and sEntiment Reasoner)
-        VADER is particularly good for social media and short texts
+        VADER polarity_scores with a fast path for text that holds no lexicon
+        words. Such text always scores as fully neutral, and deciding that
+        takes a single split instead of VADER's per-call punctuation tables.
         
         Args:
-            text (str): Input text to analyze
+            text (str): Input text to score
             
         Returns:
-            dict: Sentiment scores including compound score
+            dict: Raw VADER scores ('neg', 'neu', 'pos', 'compound')
         """
-        scores = self.sia.polarity_scores(text)
+        lexicon = self.sia.lexicon
+        has_words = False
+        for token in text.split():
+            if len(token) > 1:
+                token = token.lower()
+                # VADER looks words up as-is and with surrounding punctuation removed
+                if token in lexicon or token.strip(string.punctuation) in lexicon:
+                    return self.sia.polarity_scores(text)
+                has_words = True
+        return {'neg': 0.0, 'neu': 1.0 if has_words else 0.0, 'pos': 0.0, 'compound': 0.0}
+    
+    def _rounded_vader_scores(self, text):
+        """VADER scores under their reported names, rounded to 3 decimals"""
+        scores = self._polarity_scores(text)
         return {
             'positive': round(scores['pos'], 3),
             'negative': round(scores['neg'], 3),
@@ -115,10 +434,43 @@ class SentimentAnalyzer:
             'compound': round(scores['compound'], 3)
         }
     
+    def _rounded_textblob_scores(self, text):
+        """TextBlob (polarity, subjectivity), rounded to 3 decimals"""
+        polarity, subjectivity = pattern_sentiment(text)
+        return round(polarity, 3), round(subjectivity, 3)
+    
+    def _vader_scores(self, text):
+        """Rounded VADER scores, cached for texts up to MAX_CACHED_TEXT_LENGTH"""
+        if len(text) <= MAX_CACHED_TEXT_LENGTH:
+            return self._vader_cache(text)
+        return self._rounded_vader_scores(text)
+    
+    def _textblob_scores(self, text):
+        """Rounded TextBlob scores, cached for texts up to MAX_CACHED_TEXT_LENGTH"""
+        if len(text) <= MAX_CACHED_TEXT_LENGTH:
+            return self._textblob_cache(text)
+        return self._rounded_textblob_scores(text)
+    
+    def analyze_sentiment_vader(self, text):
+        """
+        Analyze sentiment using VADER (Valence Aware Dictionary and sEntiment Reasoner)
+        VADER is particularly good for social media and short texts
+        
+        Args:
+            text (str): Input text to analyze
+            
+        Returns:
+            dict: Sentiment scores including compound score
+        """
+        # Copied, since the rounded scores may be a shared cache entry
+        return dict(self._vader_scores(text))
+    
     def analyze_sentiment_textblob(self, text):
         """
         Analyze sentiment using TextBlob
         Provides polarity (-1 to 1) and subjectivity (0 to 1) scores
+        Calls TextBlob's pattern lexicon directly; building a TextBlob would
+        only add string normalisation and a namedtuple class per call
         
         Args:
             text (str): Input text to analyze
@@ -126,13 +478,11 @@ class SentimentAnalyzer:
         Returns:
             dict: Polarity and subjectivity scores
         """
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        polarity, subjectivity = self._textblob_scores(text)
         
         return {
-            'polarity': round(polarity, 3),
-            'subjectivity': round(subjectivity, 3)
+            'polarity': polarity,
+            'subjectivity': subjectivity
         }
     
     def classify_sentiment(self, compound_score):
@@ -153,7 +503,8 @@ class SentimentAnalyzer:
         else:
             return 'neutral'
     
-    def classify_overall_sentiment(self, vader_scores, textblob_scores, sentence_sentiments, text=""):
+    def classify_overall_sentiment(self, vader_scores, textblob_scores, sentence_sentiments, text="",
+                                   sentence_columns=None, text_lower=None):
         """
         Advanced sentiment classification that combines multiple signals:
         1. VADER compound score
@@ -170,6 +521,9 @@ class SentimentAnalyzer:
             textblob_scores (dict): TextBlob polarity and subjectivity
             sentence_sentiments (list): Per-sentence sentiment analysis
             text (str): Original text for keyword-based analysis
+            sentence_columns (tuple): Optional (labels, confidences) lists holding
+                the same per-sentence values, to skip reading them from the dicts
+            text_lower (str): Optional precomputed text.lower()
             
         Returns:
             tuple: (sentiment_label, confidence_score)
@@ -177,187 +531,135 @@ class SentimentAnalyzer:
         compound = vader_scores['compound']
         polarity = textblob_scores['polarity']
         
-        # Strong negative phrases that VADER often misses or underweights
-        strong_negative_phrases = [
-            # Direct negative expressions
-            'rubbish', 'utter rubbish', 'complete rubbish', 'total rubbish',
-            'hopeless', 'completely hopeless', 'utterly hopeless',
-            'waste of', 'waste of time', 'waste of money', 'waste of film',
-            'terrible', 'horrible', 'awful', 'dreadful', 'atrocious',
-            'error of judgment', 'huge error', 'big mistake', 'disaster',
-            'pathetic', 'abysmal', 'appalling', 'disgraceful',
-            'should hand in', 'should resign', 'should quit',
-            'unacceptable', 'inexcusable', 'unforgivable',
-            # Disappointment expressions  
-            'disappointing', 'disappointed', 'disappointment', 
-            'bitterly disappointing', 'hugely disappointing', 'let down', 'letdown',
-            'to my disappointment', 'what a disappointment',
-            # Review-specific negative phrases
-            'sad sight', 'bad imitation', 'poor imitation',
-            'pretty weak', 'very weak', 'quite weak', 'weak storyline', 'weak plot',
-            'not very good', 'not that good', 'not so good', 'isnt that good',
-            'didn\'t laugh', 'didnt laugh', 'never laughed',
-            'boring', 'tedious', 'dull', 'bland', 'mediocre', 'forgettable',
-            'wouldn\'t recommend', 'would not recommend', 'cannot recommend',
-            'don\'t bother', 'dont bother', 'skip this', 'avoid this',
-            'not worth', 'waste your time', 'save your money',
-            'fails to', 'failed to', 'lacks', 'lacking',
-            # Comparative negatives
-            'worse than', 'inferior to', 'pales in comparison',
-            'nothing like', 'far from', 'falls short'
-        ]
-        
-        # Strong positive phrases (only if NOT preceded by "hoping for", "expected", etc.)
-        strong_positive_phrases = [
-            'excellent', 'outstanding', 'brilliant', 'fantastic', 'amazing',
-            'masterpiece', 'incredible', 'superb', 'phenomenal', 'extraordinary',
-            'highly recommend', 'must see', 'must watch', 'loved it', 'love it',
-            'best ever', 'best movie', 'best film', 'thoroughly enjoyed',
-            'blown away', 'exceeded expectations', 'pleasantly surprised'
-        ]
-        
-        # Phrases that indicate positive words are being used hypothetically/negatively
-        # (e.g., "I was hoping for excellent" means they DIDN'T get excellent)
-        hope_disappointment_patterns = [
-            'hoping', 'hoped', 'expected', 'expecting', 'wanted', 
-            'wished', 'thought it would', 'should have been',
-            'could have been', 'was supposed to'
-        ]
-        
-        # Count keyword matches (case-insensitive)
-        text_lower = text.lower() if text else ""
-        negative_keyword_count = sum(1 for phrase in strong_negative_phrases if phrase in text_lower)
-        positive_keyword_count = sum(1 for phrase in strong_positive_phrases if phrase in text_lower)
-        
-        # Check for hope-disappointment pattern (positive words used in context of letdown)
-        has_hope_disappointment = any(pattern in text_lower for pattern in hope_disappointment_patterns)
-        if has_hope_disappointment and 'disappointment' in text_lower:
+        # Count keyword matches (case-insensitive) in a single pass
+        if text_lower is None:
+            text_lower = text.lower() if text else ""
+        found_phrases = find_phrases(text_lower)
+        negative_keyword_count = len(found_phrases & NEGATIVE_PHRASE_SET)
+        positive_keyword_count = len(found_phrases & POSITIVE_PHRASE_SET)
+        has_hope_disappointment = not found_phrases.isdisjoint(HOPE_PATTERN_SET)
+        
+        # Check for hope-disappointment pattern (positive words used in context of letdown).
+        # 'disappointment' is itself a negative phrase, so the match set already says
+        # whether it occurs
+        if has_hope_disappointment and 'disappointment' in found_phrases:
             # The positive words are describing what was expected, not received
             # Reduce positive count and boost negative
             positive_keyword_count = max(0, positive_keyword_count - 2)
             negative_keyword_count += 1
         
-        # Calculate keyword adjustment (-0.3 to +0.3 range)
-        keyword_adjustment = 0
-        if negative_keyword_count > positive_keyword_count:
-            keyword_adjustment = -0.1 * min(negative_keyword_count, 3)  # Cap at -0.3
-        elif positive_keyword_count > negative_keyword_count:
-            keyword_adjustment = 0.1 * min(positive_keyword_count, 3)   # Cap at +0.3
-        
         # Count sentence sentiments and their intensities
+        if sentence_columns is None:
+            labels = [sent['sentiment'] for sent in sentence_sentiments]
+            confidences = [sent['confidence'] for sent in sentence_sentiments]
+        else:
+            labels, confidences = sentence_columns
         positive_count = 0
         negative_count = 0
-        neutral_count = 0
-        negative_intensity_sum = 0
-        positive_intensity_sum = 0
+        negative_intensity_sum = 0.0
+        positive_intensity_sum = 0.0
         
-        for sent in sentence_sentiments:
-            if sent['sentiment'] == 'positive':
+        for label, confidence in zip(labels, confidences):
+            if label == 'positive':
                 positive_count += 1
-                positive_intensity_sum += sent['confidence']
-            elif sent['sentiment'] == 'negative':
+                positive_intensity_sum += confidence
+            elif label == 'negative':
                 negative_count += 1
-                negative_intensity_sum += sent['confidence']
-            else:
-                neutral_count += 1
+                negative_intensity_sum += confidence
         
-        total_sentences = len(sentence_sentiments) if sentence_sentiments else 1
-        
-        # Normalize sentence distribution to -1 to 1 scale
-        if positive_count + negative_count > 0:
-            sentence_balance = (positive_count - negative_count) / (positive_count + negative_count)
-        else:
-            sentence_balance = 0
-        
-        # Calculate average intensity for each sentiment type
-        avg_negative_intensity = negative_intensity_sum / negative_count if negative_count > 0 else 0
-        avg_positive_intensity = positive_intensity_sum / positive_count if positive_count > 0 else 0
-        
-        # Intensity adjustment: Strong negative sentences should weigh more heavily
-        intensity_adjustment = 0
-        if avg_negative_intensity > 0.5 and negative_count >= 2:
-            intensity_adjustment = -0.15 * (avg_negative_intensity - 0.5)
-        elif avg_positive_intensity > 0.5 and positive_count >= 2:
-            intensity_adjustment = 0.15 * (avg_positive_intensity - 0.5)
-        
-        # Combined weighted score with keyword adjustment
-        combined_score = (
-            compound * 0.30 +              # VADER compound (30%)
-            polarity * 0.15 +              # TextBlob polarity (15%)
-            sentence_balance * 0.25 +       # Sentence distribution (25%)
-            keyword_adjustment +            # Keyword-based adjustment
-            intensity_adjustment +
-            # Bonus weight for TextBlob when VADER and TextBlob disagree
-            (polarity * 0.10 if (compound > 0 and polarity < 0) or (compound < 0 and polarity > 0) else 0)
+        sentiment_id, confidence = _score_core(
+            float(compound), float(polarity), positive_count, negative_count,
+            positive_intensity_sum, negative_intensity_sum,
+            positive_keyword_count, negative_keyword_count
         )
+        return SENTIMENT_LABELS[sentiment_id], round(confidence, 3)
+    
+    def _score_sentences(self, sentences):
+        """
+        Score each sentence with VADER
         
-        # Classification with adjusted thresholds
-        if combined_score >= 0.12:
-            sentiment = 'positive'
-        elif combined_score <= -0.08:
-            sentiment = 'negative'
-        else:
-            # For borderline cases, keyword detection takes priority
-            if negative_keyword_count > positive_keyword_count:
-                sentiment = 'negative'
-            elif positive_keyword_count > negative_keyword_count:
-                sentiment = 'positive'
-            # Then check sentence distribution
-            elif negative_count > positive_count and avg_negative_intensity > 0.3:
-                sentiment = 'negative'
-            elif positive_count > negative_count and avg_positive_intensity > 0.3:
-                sentiment = 'positive'
-            else:
-                sentiment = 'neutral'
-        
-        # Calculate confidence
-        confidence = abs(combined_score)
-        # Boost confidence if keyword detection found strong signals
-        if negative_keyword_count >= 2 or positive_keyword_count >= 2:
-            confidence = min(confidence + 0.2, 1.0)
-        # Boost confidence if multiple signals agree
-        if (compound > 0 and polarity > 0 and sentence_balance > 0) or \
-           (compound < 0 and polarity < 0 and sentence_balance < 0):
-            confidence = min(confidence * 1.2, 1.0)
-        
-        return sentiment, round(confidence, 3)
-    
-    def get_detailed_analysis(self, text):
+        Args:
+            sentences (list): Sentence strings
+            
+        Returns:
+            tuple: (labels, confidences, per-sentence analysis dicts)
+        """
+        polarity_scores = self._vader_scores
+        compounds = [polarity_scores(sentence)['compound'] for sentence in sentences]
+        labels = [self.classify_sentiment(compound) for compound in compounds]
+        confidences = [abs(compound) for compound in compounds]
+        sentence_sentiments = [
+            {'sentence': sentence.strip(), 'sentiment': label, 'confidence': confidence}
+            for sentence, label, confidence in zip(sentences, labels, confidences)
+        ]
+        return labels, confidences, sentence_sentiments
+    
+    def get_text_analysis(self, text):
+        """
+        Compute the parts of the detailed analysis that describe the text itself
+        (tokens, counts, per-sentence sentiment and cleaned text), without the
+        document-level scores and classification
+        
+        Args:
+            text (str): Input text to analyze
+            
+        Returns:
+            dict: The text-derived fields of get_detailed_analysis
+        """
+        processed_tokens, cleaned_text = self.preprocess_text(text)
+        sentences = split_sentences(text)
+        _, _, sentence_sentiments = self._score_sentences(sentences)
+        return {
+            'processed_tokens': processed_tokens,
+            'token_count': len(processed_tokens),
+            'word_count': len(text.split()),
+            'sentence_count': len(sentences),
+            'sentence_analysis': sentence_sentiments,
+            'cleaned_text': cleaned_text
+        }
+    
+    def get_detailed_analysis(self, text, sentences=None):
         """
         Perform comprehensive sentiment analysis combining multiple methods
         
         Args:
             text (str): Input text to analyze
+            sentences (list): Optional precomputed split_sentences(text)
             
         Returns:
             dict: Comprehensive sentiment analysis results
         """
-        # Preprocessing
-        processed_tokens, cleaned_text = self.preprocess_text(text)
+        if _TRIVIAL_RE.fullmatch(text):
+            return self._get_trivial_analysis(text)
         
-        # VADER Analysis
-        vader_scores = self.analyze_sentiment_vader(text)
+        # Preprocessing; the lowercased text is shared with keyword detection
+        text_lower = text.lower()
+        processed_tokens, cleaned_text = self.preprocess_text(text, text_lower)
+        
+        # Sentence-level analysis (needed for advanced classification)
+        if sentences is None:
+            sentences = split_sentences(text)
+        sentence_labels, sentence_confidences, sentence_sentiments = self._score_sentences(sentences)
+        
+        # VADER Analysis. A single-sentence text reuses its sentence score
+        # (VADER ignores surrounding whitespace); longer texts need their own
+        # pass since the compound score is not an average of sentence scores.
+        if len(sentences) == 1 and sentences[0] == text.strip():
+            vader_scores = self.analyze_sentiment_vader(sentences[0])
+        else:
+            vader_scores = self.analyze_sentiment_vader(text)
         
         # TextBlob Analysis
         textblob_scores = self.analyze_sentiment_textblob(text)
         
-        # Sentence-level analysis (needed for advanced classification)
-        sentences = sent_tokenize(text)
-        sentence_sentiments = []
-        for sentence in sentences:
-            sent_scores = self.analyze_sentiment_vader(sentence)
-            sentence_sentiments.append({
-                'sentence': sentence.strip(),
-                'sentiment': self.classify_sentiment(sent_scores['compound']),
-                'confidence': abs(sent_scores['compound'])
-            })
-        
         # Advanced classification using multiple signals
         sentiment, confidence = self.classify_overall_sentiment(
             vader_scores, 
             textblob_scores, 
             sentence_sentiments,
-            text  # Pass original text for keyword-based analysis
+            text,  # Pass original text for keyword-based analysis
+            sentence_columns=(sentence_labels, sentence_confidences),
+            text_lower=text_lower
         )
         
         return {
@@ -367,26 +669,129 @@ class SentimentAnalyzer:
             'textblob_scores': textblob_scores,
             'processed_tokens': processed_tokens,
             'token_count': len(processed_tokens),
+            'word_count': len(text.split()),
             'sentence_count': len(sentences),
             'sentence_analysis': sentence_sentiments,
             'cleaned_text': cleaned_text
         }
     
-    def analyze_multiple_texts(self, texts):
+    def _get_trivial_analysis(self, text):
         """
-        Analyze sentiment for multiple texts
+        Build the neutral result for text without any words, skipping
+        preprocessing, TextBlob, keyword matching and the overall
+        classification. Gives the same result as the full pipeline
         
         Args:
-            texts (list): List of texts to analyze
+            text (str): Input text matching _TRIVIAL_RE
             
         Returns:
-            list: List of analysis results for each text
+            dict: Comprehensive sentiment analysis results
         """
+        # Lowercasing is a no-op and only commas match _PREPROCESS_RE, so
+        # cleaning leaves no word tokens
+        cleaned_text = _WS_RE.sub(' ', text.replace(',', '')).strip()
+        
+        # Whitespace-only text has no sentences with either splitter; other
+        # splits are cached per text
+        if not text.strip():
+            sentences = []
+        elif len(text) <= MAX_CACHED_TEXT_LENGTH:
+            sentences = list(self._trivial_split_cache(text))
+        else:
+            sentences = split_sentences(text)
+        
+        return {
+            'overall_sentiment': 'neutral',
+            'confidence': 0.0,
+            # No lexicon entry can match, so this takes _polarity_scores' fast path
+            'vader_scores': self._rounded_vader_scores(text),
+            'textblob_scores': {'polarity': 0.0, 'subjectivity': 0.0},
+            'processed_tokens': [],
+            'token_count': 0,
+            'word_count': len(text.split()),
+            'sentence_count': len(sentences),
+            'sentence_analysis': [
+                {'sentence': sentence.strip(), 'sentiment': 'neutral', 'confidence': 0.0}
+                for sentence in sentences
+            ],
+            'cleaned_text': cleaned_text
+        }
+    
+    def get_detailed_analysis_many(self, texts):
+        """
+        Perform comprehensive sentiment analysis for a batch of texts
+        Gives the same results as get_detailed_analysis on each text, but
+        analyzes repeated texts once and splits all sentences in one pass
+        
+        Args:
+            texts (list): Input texts to analyze
+            
+        Returns:
+            list: Comprehensive sentiment analysis results, one per text
+        """
+        unique = list(dict.fromkeys(texts))
+        # Trivial texts take a shortcut that needs no sentence split
+        to_split = [text for text in unique if not _TRIVIAL_RE.fullmatch(text)]
+        split = dict(zip(to_split, split_sentences_many(to_split)))
+        
+        analyze = self.get_detailed_analysis
+        analyses = {text: analyze(text, split.get(text)) for text in unique}
+        
+        # Repeats get their own copy, so callers can mutate any result
         results = []
+        seen = set()
         for text in texts:
-            result = self.get_detailed_analysis(text)
-            results.append(result)
+            analysis = analyses[text]
+            results.append(copy.deepcopy(analysis) if text in seen else analysis)
+            seen.add(text)
         return results
+    
+    def analyze_multiple_texts(self, texts, workers=None):
+        """
+        Analyze sentiment for multiple texts
+        Large batches are spread over a process pool; small ones run inline
+        since starting the workers costs more than it saves
+        
+        Args:
+            texts (list): List of texts to analyze
+            workers (int): Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            list: List of analysis results for each text
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(texts) < PARALLEL_MIN_TEXTS:
+            return self.get_detailed_analysis_many(texts)
+        
+        chunksize = max(1, len(texts) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return list(executor.map(_analyze_in_worker, texts, chunksize=chunksize))
+
+
+# Batches smaller than this are analyzed in-process by analyze_multiple_texts
+PARALLEL_MIN_TEXTS = 200
+
+# Analyzer owned by a pool worker process, built once by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker():
+    """Build the worker process's analyzer so NLTK models load once per worker"""
+    global _worker_analyzer
+    _worker_analyzer = SentimentAnalyzer()
+
+
+def _analyze_in_worker(text):
+    """
+    Analyze one text inside a pool worker
+    
+    Args:
+        text (str): Input text to analyze
+        
+    Returns:
+        dict: Comprehensive sentiment analysis results
+    """
+    return _worker_analyzer.get_detailed_analysis(text)
 
 
 # Utility functions